@@ -1,10 +1,12 @@
 """Check permissions for a pull request and request a review if needed"""
 
 import argparse
+import functools
 import json
 import logging
 import os
 import urllib
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Any
 
 from github import Auth, Github, UnknownObjectException
@@ -16,6 +18,9 @@ from operatorcert.utils import run_command
 
 LOGGER = logging.getLogger("operator-cert")
 
+# Maximum number of operator reviews running in parallel
+MAX_REVIEW_WORKERS = 8
+
 
 class NoPermissionError(Exception):
     """Exception raised when user does not have permissions to submit a PR"""
@@ -387,6 +392,29 @@ def extract_operators_from_catalog(
     return operators
 
 
+def review_operator(operator_review: OperatorReview) -> bool:
+    """
+    Check permissions for a single operator and request a review from
+    maintainers if needed
+
+    Args:
+        operator_review (OperatorReview): A review of the affected operator
+
+    Returns:
+        bool: A boolean value indicating if the user has permissions to submit
+        a PR for the operator
+    """
+    try:
+        return operator_review.check_permissions()
+    except MaintainersReviewNeeded as exc:
+        LOGGER.info(
+            f"Operator %s requires a review from maintainers. {exc}",
+            operator_review.operator.operator_name,
+        )
+        operator_review.request_review_from_maintainers()
+        return False
+
+
 def check_permissions(
     base_repo: OperatorRepo,
     head_repo: OperatorRepo,
@@ -401,6 +429,10 @@ def check_permissions(
         head_repo (OperatorRepo): A head git repository
         args (Any): CLI arguments
 
+    Raises:
+        NoPermissionError: An exception raised when user does not have permissions
+        to submit a PR for one of the operators
+
     Returns:
         bool: A boolean value indicating if the user has permissions to submit a PR
     """
@@ -437,9 +469,8 @@ def check_permissions(
         extract_operators_from_catalog(base_repo, removed_catalog_operators)
     )
 
-    is_approved = []
-    for operator in operators:
-        operator_review = OperatorReview(
+    operator_reviews = [
+        OperatorReview(
             operator,
             args.pr_owner,
             base_repo,
@@ -447,20 +478,69 @@ def check_permissions(
             args.pull_request_url,
             args.pyxis_url,
         )
+        for operator in operators
+    ]
+
+    # Each review talks to Github and Pyxis, run them concurrently so the
+    # total time doesn't grow with the number of affected operators
+    is_approved = []
+    with ThreadPoolExecutor(max_workers=MAX_REVIEW_WORKERS) as executor:
+        futures = {
+            executor.submit(review_operator, operator_review): operator_review
+            for operator_review in operator_reviews
+        }
         try:
-            result = operator_review.check_permissions()
-            is_approved.append(result)
-        except MaintainersReviewNeeded as exc:
-            LOGGER.info(
-                f"Operator %s requires a review from maintainers. {exc}",
-                operator.operator_name,
-            )
-            operator_review.request_review_from_maintainers()
-            is_approved.append(False)
+            for future in as_completed(futures):
+                is_approved.append(future.result())
+        except Exception as exc:
+            # Don't start any other review, the check is going to fail anyway
+            # and the PR shouldn't get more comments or review requests
+            executor.shutdown(cancel_futures=True)
+            log_failed_reviews(futures, exc)
+            raise
 
     return all(is_approved)
 
 
+def log_failed_reviews(
+    futures: dict[Future[bool], OperatorReview], raised: BaseException
+) -> None:
+    """
+    Log failures of operator reviews that are not re-raised to the caller
+
+    Args:
+        futures (dict[Future[bool], OperatorReview]): Submitted operator reviews
+        raised (BaseException): The exception that is re-raised to the caller
+    """
+    for future, operator_review in futures.items():
+        if future.cancelled():
+            continue
+        exc = future.exception()
+        if exc is None or exc is raised:
+            continue
+        LOGGER.error(
+            "Permission check for operator %s failed: %s",
+            operator_review.operator.operator_name,
+            exc,
+        )
+
+
+@functools.lru_cache(maxsize=4)
+def open_repo(path: str) -> OperatorRepo:
+    """
+    Open an operator repository. Repositories are cached by path so the base
+    and head repository share the same instance when they point to the same
+    directory.
+
+    Args:
+        path (str): Path to the git repository
+
+    Returns:
+        OperatorRepo: An operator repository
+    """
+    return OperatorRepo(path)
+
+
 def main() -> None:
     """
     Main function of the script
@@ -475,8 +555,8 @@ def main() -> None:
         log_level = "DEBUG"
     setup_logger(level=log_level)
 
-    base_repo = OperatorRepo(args.repo_base_path)
-    head_repo = OperatorRepo(args.repo_head_path)
+    base_repo = open_repo(args.repo_base_path)
+    head_repo = open_repo(args.repo_head_path)
 
     is_approved = check_permissions(base_repo, head_repo, args)
 
@@ -5,13 +5,16 @@ import json
 import logging
 from datetime import datetime
 from typing import Any, Dict
-from urllib.parse import quote, urljoin
+from urllib.parse import quote
 
 from operatorcert import pyxis
 from operatorcert.logger import setup_logger
 
 LOGGER = logging.getLogger("operator-cert")
 
+# Static part of the image filter, quoted only once
+NOT_DELETED_FILTER = quote(";not(deleted==true)")
+
 
 def setup_argparser() -> Any:  # pragma: no cover
     """
@@ -65,6 +68,20 @@ def setup_argparser() -> Any:  # pragma: no cover
     return parser
 
 
+def _images_url(args: Any) -> str:
+    """
+    Get Pyxis URL of the images API. The base URL is extended with the API path
+    regardless of whether it ends with a slash.
+
+    Args:
+        args (Any): CLI arguments
+
+    Returns:
+        str: Pyxis images API URL
+    """
+    return f"{args.pyxis_url.rstrip('/')}/v1/images"
+
+
 def check_if_image_already_exists(args: Any) -> Any:
     """
     Check if image with given docker_image_digest and isv_pid already exists
@@ -73,16 +90,20 @@ def check_if_image_already_exists(args: Any) -> Any:
         args (Any): CLI arguments
 
     Returns:
-        Any: Container image object if image already exists, else None
+        Any: Container image object with its _id if image already exists,
+        else None
     """
     # quote is needed to urlparse the quotation marks
-    filter_str = quote(
-        f'isv_pid=="{args.isv_pid}";'
-        f'docker_image_digest=="{args.docker_image_digest}";'
-        f"not(deleted==true)"
+    filter_str = (
+        quote(
+            f'isv_pid=="{args.isv_pid}";'
+            f'docker_image_digest=="{args.docker_image_digest}"'
+        )
+        + NOT_DELETED_FILTER
     )
 
-    check_url = urljoin(args.pyxis_url, f"v1/images?page_size=1&filter={filter_str}")
+    # Only the image _id is needed by the pipeline, skip the rest of the document
+    check_url = f"{_images_url(args)}?page_size=1&include=data._id&filter={filter_str}"
 
     # Get the list of the ContainerImages with given parameters
     rsp = pyxis.get(check_url)
@@ -152,10 +173,10 @@ def create_container_image(args: Any, skopeo_result: Dict[str, Any]) -> Any:
     """
     LOGGER.info("Creating new container image")
 
-    date_now = datetime.now().strftime("%Y-%m-%dT%H:%M:%S.%f+00:00")
+    date_now = datetime.now().isoformat(timespec="microseconds") + "+00:00"
     parsed_data = prepare_parsed_data(skopeo_result)
 
-    upload_url = urljoin(args.pyxis_url, "v1/images")
+    upload_url = _images_url(args)
     container_image_payload = {
         "isv_pid": args.isv_pid,
         "repositories": [
@@ -197,12 +218,13 @@ def main() -> None:  # pragma: no cover
     log_level = "DEBUG" if args.verbose else "INFO"
     setup_logger(level=log_level)
 
-    with open(args.skopeo_result, encoding="utf-8") as json_file:
-        skopeo_result = json.load(json_file)
-
     image = check_if_image_already_exists(args)
 
     if not image:
+        # The skopeo result is only needed when a new image is created
+        # json.loads accepts bytes directly, no need for a text decoding layer
+        with open(args.skopeo_result, "rb") as json_file:
+            skopeo_result = json.loads(json_file.read())
         image = create_container_image(args, skopeo_result)
 
     if args.output_file:
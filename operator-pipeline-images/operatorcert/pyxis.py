@@ -1,5 +1,6 @@
 """Pyxis API client"""
 
+import functools
 import logging
 import os
 import time
@@ -27,9 +28,11 @@ def is_internal() -> bool:
 
 def _get_session(pyxis_url: str, auth_required: bool = True) -> requests.Session:
     """
-    Create a Pyxis http session with auth based on env variables.
+    Get a Pyxis http session with auth based on env variables.
 
     Auth is optional and can be set to use either API key or certificate + key.
+    Sessions are reused across calls with the same configuration so the
+    underlying connection pool (and TLS handshake) is shared between requests.
 
     Args:
         url (str): Pyxis API URL
@@ -41,15 +44,44 @@ def _get_session(pyxis_url: str, auth_required: bool = True) -> requests.Session
     Returns:
         requests.Session: Pyxis session
     """
-    api_key = os.environ.get("PYXIS_API_KEY")
-    cert = os.environ.get("PYXIS_CERT_PATH")
-    key = os.environ.get("PYXIS_KEY_PATH")
+    # If it is external preprod
+    is_preprod = any(env in pyxis_url for env in ["dev", "qa", "stage"])
+    return _create_session(
+        os.environ.get("PYXIS_API_KEY"),
+        os.environ.get("PYXIS_CERT_PATH"),
+        os.environ.get("PYXIS_KEY_PATH"),
+        is_preprod,
+        auth_required,
+    )
+
+
+@functools.lru_cache
+def _create_session(
+    api_key: Optional[str],
+    cert: Optional[str],
+    key: Optional[str],
+    is_preprod: bool,
+    auth_required: bool,
+) -> requests.Session:
+    """
+    Create a Pyxis http session for the given auth configuration.
+
+    Args:
+        api_key (Optional[str]): Pyxis API key
+        cert (Optional[str]): Path to a Pyxis client certificate
+        key (Optional[str]): Path to a Pyxis client key
+        is_preprod (bool): Whether the session targets external preprod Pyxis
+        auth_required (bool): Whether authentication should be required for the session
 
+    Raises:
+        Exception: Exception is raised when auth details are missing.
+
+    Returns:
+        requests.Session: Pyxis session
+    """
     # Document about the proxy configuration:
     # https://source.redhat.com/groups/public/customer-platform-devops/digital_experience_operations_dxp_ops_wiki/using_squid_proxy_to_access_akamai_preprod_domains_over_vpn
     proxies = {}
-    # If it is external preprod
-    is_preprod = any(env in pyxis_url for env in ["dev", "qa", "stage"])
     if is_preprod and api_key:
         proxies = {
             "http": "http://squid.corp.redhat.com:3128",
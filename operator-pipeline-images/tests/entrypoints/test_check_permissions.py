@@ -1,3 +1,5 @@
+import threading
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Any, Optional
 from unittest import mock
@@ -10,6 +12,11 @@ from operator_repo import Repo as OperatorRepo
 from tests.utils import bundle_files, create_files
 
 
+@pytest.fixture(autouse=True)
+def clear_repo_cache() -> None:
+    check_permissions.open_repo.cache_clear()
+
+
 @pytest.fixture
 def review_partner(tmp_path: Path) -> check_permissions.OperatorReview:
     create_files(
@@ -435,6 +442,7 @@ def test_check_permissions(
 
     result = check_permissions.check_permissions(base_repo, head_repo, MagicMock())
     assert not result
+    mock_review.return_value.request_review_from_maintainers.assert_called_once()
 
     head_repo.operator.assert_has_calls([call("operator1"), call("operator2")])
     base_repo.operator.assert_has_calls([call("operator3")])
@@ -446,6 +454,101 @@ def test_check_permissions(
     )
 
 
+@patch("operatorcert.entrypoints.check_permissions.OperatorReview")
+@patch("operatorcert.entrypoints.check_permissions.extract_operators_from_catalog")
+@patch("operatorcert.entrypoints.check_permissions.json.load")
+@patch("builtins.open")
+def test_check_permissions_no_permission(
+    mock_open: MagicMock,
+    mock_json_load: MagicMock,
+    mock_catalog_operators: MagicMock,
+    mock_review: MagicMock,
+) -> None:
+    head_repo = MagicMock()
+    mock_json_load.return_value = {"added_operators": ["operator1"]}
+    mock_catalog_operators.return_value = set()
+    mock_review.return_value.check_permissions.side_effect = (
+        check_permissions.NoPermissionError("error")
+    )
+
+    with pytest.raises(check_permissions.NoPermissionError):
+        check_permissions.check_permissions(MagicMock(), head_repo, MagicMock())
+
+    mock_review.return_value.check_permissions.assert_called_once()
+    mock_review.return_value.request_review_from_maintainers.assert_not_called()
+
+
+@patch("operatorcert.entrypoints.check_permissions.OperatorReview")
+@patch("operatorcert.entrypoints.check_permissions.extract_operators_from_catalog")
+@patch("operatorcert.entrypoints.check_permissions.json.load")
+@patch("builtins.open")
+def test_check_permissions_multiple_failures(
+    mock_open: MagicMock,
+    mock_json_load: MagicMock,
+    mock_catalog_operators: MagicMock,
+    mock_review: MagicMock,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    head_repo = MagicMock()
+    mock_json_load.return_value = {"added_operators": ["operator1", "operator2"]}
+    head_repo.operator.side_effect = [MagicMock(), MagicMock()]
+    mock_catalog_operators.return_value = set()
+
+    # Both reviews are running before either of them fails
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fail(message: str) -> Any:
+        def check() -> None:
+            barrier.wait()
+            raise check_permissions.NoPermissionError(message)
+
+        return check
+
+    review1 = MagicMock()
+    review1.operator.operator_name = "operator1"
+    review1.check_permissions.side_effect = fail("error1")
+    review2 = MagicMock()
+    review2.operator.operator_name = "operator2"
+    review2.check_permissions.side_effect = fail("error2")
+    mock_review.side_effect = [review1, review2]
+
+    with pytest.raises(check_permissions.NoPermissionError) as exc:
+        check_permissions.check_permissions(MagicMock(), head_repo, MagicMock())
+
+    # The failure that is not re-raised is logged
+    not_raised = "error2" if str(exc.value) == "error1" else "error1"
+    assert f"failed: {not_raised}" in caplog.text
+
+
+def test_log_failed_reviews(caplog: pytest.LogCaptureFixture) -> None:
+    raised = check_permissions.NoPermissionError("raised")
+
+    futures: dict[Future[bool], Any] = {}
+    for name, outcome in [
+        ("operator1", None),
+        ("operator2", True),
+        ("operator3", raised),
+        ("operator4", check_permissions.NoPermissionError("not raised")),
+    ]:
+        future: Future[bool] = Future()
+        if outcome is None:
+            future.cancel()
+        elif isinstance(outcome, Exception):
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+        review = MagicMock()
+        review.operator.operator_name = name
+        futures[future] = review
+
+    check_permissions.log_failed_reviews(futures, raised)
+
+    assert len(caplog.records) == 1
+    assert caplog.records[0].getMessage() == (
+        "Permission check for operator operator4 failed: not raised"
+    )
+
+
 @patch("operatorcert.entrypoints.check_permissions.json.dump")
 @patch("operatorcert.entrypoints.check_permissions.run_command")
 @patch("operatorcert.entrypoints.check_permissions.check_permissions")
@@ -490,5 +593,18 @@ def test_main(
     mock_json_dump.assert_called_once_with(expected_output, mock.ANY)
 
 
+@patch("operatorcert.entrypoints.check_permissions.OperatorRepo")
+def test_open_repo(mock_operator_repo: MagicMock, tmp_path: Path) -> None:
+    mock_operator_repo.side_effect = [MagicMock(), MagicMock()]
+
+    base_repo = check_permissions.open_repo(str(tmp_path / "repo"))
+    head_repo = check_permissions.open_repo(str(tmp_path / "repo"))
+    other_repo = check_permissions.open_repo(str(tmp_path / "other-repo"))
+
+    assert base_repo is head_repo
+    assert base_repo is not other_repo
+    assert mock_operator_repo.call_count == 2
+
+
 def test_setup_argparser() -> None:
     assert check_permissions.setup_argparser() is not None
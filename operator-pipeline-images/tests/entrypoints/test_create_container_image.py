@@ -2,7 +2,9 @@ import json
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+import pytest
 from operatorcert.entrypoints.create_container_image import (
+    _images_url,
     check_if_image_already_exists,
     create_container_image,
     get_image_size,
@@ -10,6 +12,20 @@ from operatorcert.entrypoints.create_container_image import (
 )
 
 
+@pytest.mark.parametrize(
+    "pyxis_url",
+    [
+        "https://pyxis.engineering.redhat.com",
+        "https://pyxis.engineering.redhat.com/",
+    ],
+)
+def test_images_url(pyxis_url: str) -> None:
+    args = MagicMock()
+    args.pyxis_url = pyxis_url
+
+    assert _images_url(args) == "https://pyxis.engineering.redhat.com/v1/images"
+
+
 @patch("operatorcert.entrypoints.create_container_image.pyxis.get")
 def test_check_if_image_already_exists(mock_get: MagicMock) -> None:
     # Arrange
@@ -29,7 +45,7 @@ def test_check_if_image_already_exists(mock_get: MagicMock) -> None:
     # Assert
     assert exists == {}
     mock_get.assert_called_with(
-        "https://catalog.redhat.com/api/containers/v1/images?page_size=1&filter=isv_pid%3D%3D%22some_isv_pid%22%3Bdocker_image_digest%3D%3D%22some_digest%22%3Bnot%28deleted%3D%3Dtrue%29"
+        "https://catalog.redhat.com/api/containers/v1/images?page_size=1&include=data._id&filter=isv_pid%3D%3D%22some_isv_pid%22%3Bdocker_image_digest%3D%3D%22some_digest%22%3Bnot%28deleted%3D%3Dtrue%29"
     )
 
     # Image doesn't exist
@@ -7,6 +7,11 @@ from operatorcert import pyxis
 from requests import HTTPError, Response
 
 
+@pytest.fixture(autouse=True)
+def clear_session_cache() -> None:
+    pyxis._create_session.cache_clear()
+
+
 def test_is_internal(monkeypatch: Any) -> None:
     assert not pyxis.is_internal()
 
@@ -66,6 +71,18 @@ def test_get_session_no_credentials(monkeypatch: Any) -> None:
         pyxis._get_session("test")
 
 
+def test_get_session_reused(monkeypatch: Any) -> None:
+    monkeypatch.setenv("PYXIS_API_KEY", "123")
+    session = pyxis._get_session("https://pyxis.engineering.redhat.com/v1/images")
+
+    assert pyxis._get_session("https://pyxis.engineering.redhat.com/v1") is session
+    assert pyxis._get_session("https://pyxis.qa.redhat.com/v1") is not session
+    assert pyxis._get_session("test", auth_required=False) is not session
+
+    monkeypatch.setenv("PYXIS_API_KEY", "456")
+    assert pyxis._get_session("test") is not session
+
+
 @patch("operatorcert.pyxis._get_session")
 def test_post(mock_session: MagicMock) -> None:
     mock_session.return_value.post.return_value.json.return_value = {"key": "val"}